@@ -1,13 +1,20 @@
 import os
+import errno
 import shutil
 import logging
+import logging.handlers
 import threading
+from collections import defaultdict, deque
+from operator import itemgetter
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext
+from tkinter import filedialog, messagebox, scrolledtext, ttk
 import webbrowser # Added for the "Contact Us" feature
 
 # --- Attempt to import Matplotlib ---
 try:
+    import numpy as np # Always installed alongside Matplotlib
     import matplotlib.pyplot as plt
     from matplotlib.figure import Figure
     from matplotlib.ticker import FuncFormatter
@@ -16,6 +23,8 @@ try:
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 # --- Main Application Class (GUI and Backend Logic) ---
 class FileOrganizerApp:
     """
@@ -37,17 +46,27 @@ class FileOrganizerApp:
             "Scripts": [".py", ".js", ".html", ".css", ".sh", ".bat"],
             "Others": []  # Default category for unclassified files
         }
+        # Flattened extension -> category lookup used on the per-file hot path
+        self.EXT_TO_CATEGORY = {ext: cat for cat, exts in self.FILE_TYPE_MAP.items() for ext in exts}
+        self.SKIP_FILE_NAMES = frozenset(["file_organizer_app.py", "file_organizer.log"]) # Never moved by the organizer
+        self.SORT_MOVES_BY_INODE = os.name != "nt" # Inode order improves HDD locality; meaningless on Windows
 
         # --- Logging Setup ---
-        logging.basicConfig(
-            filename='file_organizer.log',
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        # Records are buffered and written to the file in batches of 500 (errors flush immediately)
+        if not logger.handlers:
+            file_handler = logging.FileHandler('file_organizer.log', encoding='utf-8')
+            file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S'))
+            logger.addHandler(logging.handlers.MemoryHandler(capacity=500, target=file_handler))
+        logger.setLevel(logging.INFO)
 
         # --- State Management ---
-        self.last_move_actions = [] # For the Undo feature
+        self.UNDO_HISTORY_LIMIT = 100000 # Caps undo-log memory on very large runs
+        self.last_move_actions = deque(maxlen=self.UNDO_HISTORY_LIMIT) # (category, item_name) pairs for the Undo feature
+        self._last_target_path = None # Directory the undo log's entries are relative to
+        self._cached_plan = None # (target_path, dir mtime_ns, plan, all_file_sizes, created_dirs) from the last scan
+        self.move_lock = threading.Lock() # Guards last_move_actions while moves run in parallel
+        self.log_queue = queue.Queue() # Worker threads post log lines and progress updates here; drained on the Tk thread
+        self.SCAN_PROGRESS_INTERVAL = 1000 # Log a "scanned N files" line this often during long scans
 
         # --- Window and Style Configuration ---
         self.root = root
@@ -74,87 +93,233 @@ class FileOrganizerApp:
         # --- Initialize UI ---
         self.create_widgets()
         self.apply_theme("dark") # Apply dark theme on startup
+        self.root.after(33, self._drain_log_queue)
 
     # --- Backend Logic ---
-    def organize_directory(self, target_path: str, dry_run: bool = False):
+    def log_and_update(self, message: str, level: str = "info"):
+        """Queues a message for the activity log and writes it to the log file."""
+        self.log_queue.put(message)
+        if level == "info": logger.info(message)
+        elif level == "error": logger.error(message)
+        elif level == "warning": logger.warning(message)
+
+    def report_progress(self, percent):
+        """Queues a progress bar update; None means scanning, where the total is not yet known."""
+        self.log_queue.put(("progress", percent))
+
+    def flush_log_file(self):
+        """Writes any buffered log records to file_organizer.log."""
+        for handler in logger.handlers:
+            handler.flush()
+
+    def organize_directory(self, target_path: str, dry_run: bool = False, max_workers: int = 8):
         """
         Scans, analyzes, and organizes files into subfolders based on their extension.
         """
-        def log_and_update(message: str, level: str = "info"):
-            self.root.after(0, self.update_log_area, message)
-            if level == "info": logging.info(message)
-            elif level == "error": logging.error(message)
-            elif level == "warning": logging.warning(message)
-        
         log_prefix = "[DRY RUN] " if dry_run else ""
-        log_and_update(f"🚀 {log_prefix}Starting organization process for: {target_path}")
+        self.log_and_update(f"🚀 {log_prefix}Starting organization process for: {target_path}")
         
         if not dry_run:
             self.last_move_actions.clear()
+            self._last_target_path = target_path
 
-        analytics_data = {category: {'count': 0, 'size': 0} for category in self.FILE_TYPE_MAP.keys()}
-        analytics_data["Others"] = {'count': 0, 'size': 0}
-        files_processed_count = 0
-        all_file_sizes = []
-
+        completed = False
         try:
-            all_items = os.listdir(target_path)
+            # Taken before scanning so any change made during the scan also invalidates the cache
+            dir_mtime = os.stat(target_path).st_mtime_ns
+            cached = self._cached_plan
+            if cached is not None and cached[0] == target_path and cached[1] == dir_mtime:
+                # Nothing was added, removed, or renamed since the last scan (e.g. a dry run), so reuse it
+                plan, all_file_sizes, created_dirs = cached[2:]
+                self.log_and_update("Directory unchanged since the last scan; reusing its results.")
+            else:
+                plan, all_file_sizes, created_dirs = self._build_plan(target_path)
+                self._cached_plan = (target_path, dir_mtime, plan, all_file_sizes, created_dirs)
+
+            # The plan already holds every file's category and size, so the dashboard can render before any move
+            if MATPLOTLIB_AVAILABLE:
+                analytics_data = {category: {'count': len(plan.get(category, ())),
+                                             'size': sum(size for _, _, size, _ in plan.get(category, ()))}
+                                  for category in self.FILE_TYPE_MAP}
+                # Convert once here, off the Tk thread, so the histogram gets a contiguous typed array
+                file_sizes = np.array(all_file_sizes, dtype=np.int64)
+                self.root.after(0, self.update_analytics_dashboard, analytics_data, file_sizes)
+
+            if not dry_run:
+                self._cached_plan = None # Moving files changes the directory
+            files_processed_count = self._execute_plan(target_path, plan, dry_run, created_dirs, max_workers)
             
-            for item_name in all_items:
-                source_item_path = os.path.join(target_path, item_name)
+            if files_processed_count == 0:
+                self.log_and_update("Info: No new files were found to organize.")
+
+            self.log_and_update(f"✅ {log_prefix}Organization complete!")
+            completed = True
+
+        except Exception as e:
+            self.log_and_update(f"An unexpected error occurred: {e}", "error")
+        finally:
+            # Sent through the queue so it lands after every update the run already posted
+            self.report_progress(100 if completed else 0)
+            self.flush_log_file()
+            self.root.after(0, self.finalize_organization, dry_run)
+
+    def _build_plan(self, target_path: str):
+        """
+        Pass 1: categorizes every file in target_path without touching the disk.
+        Returns (plan, all_file_sizes, created_dirs), where plan maps each category to a
+        list of (source, item_name, size, inode) tuples and created_dirs holds the category
+        folders that already exist.
+        """
+        plan = defaultdict(list)
+        all_file_sizes = []
+        created_dirs = set() # Category folders known to exist, so makedirs runs at most once per folder
+        add_size = all_file_sizes.append
+        interval = self.SCAN_PROGRESS_INTERVAL
+
+        self.report_progress(None)
+        for files_seen, (category, source, item_name, file_size, inode) in self._scan_and_classify(target_path, created_dirs):
+            add_size(file_size)
+            plan[category].append((source, item_name, file_size, inode))
+            if files_seen % interval == 0:
+                self.log_and_update(f"Scanned {files_seen} files so far...")
+
+        return plan, all_file_sizes, created_dirs
 
-                if item_name in ["file_organizer_app.py", "file_organizer.log"]:
+    def _scan_and_classify(self, target_path: str, created_dirs: set):
+        """
+        Lazily walks target_path, yielding (files_seen, (category, source, item_name, size, inode))
+        for each file as soon as it is read, so callers can report progress on slow (e.g.
+        network) directories. Existing category folders are added to created_dirs.
+        """
+        # Bind hot-path lookups to locals once; this loop runs for every entry in the directory
+        get_category = self.EXT_TO_CATEGORY.get
+        skip_names = self.SKIP_FILE_NAMES
+        categories = self.FILE_TYPE_MAP
+        want_inode = self.SORT_MOVES_BY_INODE # DirEntry.inode() is free on POSIX but costs a stat on Windows
+        files_seen = 0
+
+        with os.scandir(target_path) as entries:
+            for entry in entries:
+                item_name = entry.name
+                if item_name in skip_names:
                     continue
 
-                if os.path.isdir(source_item_path):
-                    log_and_update(f"Skipping: '{item_name}' (is a directory).")
+                # Follows symlinks like os.path.isdir did, so a link to a directory is skipped too;
+                # only symlinks cost a stat here, real entries are answered from the listing
+                if entry.is_dir():
+                    if item_name in categories:
+                        created_dirs.add(entry.path)
+                    self.log_and_update(f"Skipping: '{item_name}' (is a directory).")
                     continue
-                
+            
                 try:
-                    file_ext = os.path.splitext(item_name)[1].lower()
-                    file_size = os.path.getsize(source_item_path)
-                    all_file_sizes.append(file_size)
-                    category = "Others"
-                    for cat, exts in self.FILE_TYPE_MAP.items():
-                        if file_ext in exts:
-                            category = cat
-                            break
-                    analytics_data[category]['count'] += 1
-                    analytics_data[category]['size'] += file_size
+                    # Follows symlinks like os.path.getsize did, so a dangling link is skipped below;
+                    # for regular files this is the only stat, as is_dir() came from the directory listing
+                    file_size = entry.stat().st_size
                 except OSError as e:
-                    log_and_update(f"Warning: Could not analyze '{item_name}': {e}", "warning")
+                    self.log_and_update(f"Warning: Could not analyze '{item_name}': {e}", "warning")
                     continue
 
-                dest_folder_path = os.path.join(target_path, category)
-                final_dest_path = os.path.join(dest_folder_path, item_name)
-
-                if dry_run:
-                    log_and_update(f"{log_prefix}Would move: '{item_name}' -> '{category}'")
+                # One right-to-left scan; an empty stem means no extension (e.g. '.bashrc'), as with splitext
+                stem, _, tail = item_name.rpartition('.')
+                category = get_category('.' + tail.lower() if stem else "", "Others")
+                files_seen += 1
+                yield files_seen, (category, entry.path, item_name, file_size, entry.inode() if want_inode else 0)
+
+    def _execute_plan(self, target_path: str, plan, dry_run: bool, created_dirs: set, max_workers: int = 8) -> int:
+        """Pass 2: performs (or previews) the moves in the plan and returns how many files were handled."""
+        if dry_run:
+            files_processed_count = 0
+            for category, files in plan.items():
+                for _, item_name, _, _ in files:
+                    self.log_and_update(f"[DRY RUN] Would move: '{item_name}' -> '{category}'")
                     files_processed_count += 1
-                else:
-                    try:
-                        os.makedirs(dest_folder_path, exist_ok=True)
-                        shutil.move(source_item_path, final_dest_path)
-                        log_and_update(f"Moved: '{item_name}' -> '{category}'")
-                        self.last_move_actions.append((final_dest_path, source_item_path))
-                        files_processed_count += 1
-                    except shutil.Error as e:
-                        log_and_update(f"Warning: Could not move '{item_name}'. It may already exist. Details: {e}", "warning")
-                    except Exception as e:
-                        log_and_update(f"Error moving '{item_name}': {e}", "error")
-
-            if MATPLOTLIB_AVAILABLE:
-                self.root.after(0, self.update_analytics_dashboard, analytics_data, all_file_sizes)
-            
-            if files_processed_count == 0:
-                log_and_update("Info: No new files were found to organize.")
-
-            log_and_update(f"✅ {log_prefix}Organization complete!")
+            return files_processed_count
+
+        # Plain concatenation instead of os.path.join: category is a fixed key and item_name comes
+        # from DirEntry.name, which never contains a separator
+        sep = os.sep
+        base_path = target_path.rstrip(sep + (os.altsep or "")) + sep
+        dest_folders = {category: base_path + category for category in plan}
+
+        # Renaming in inode order lets the I/O scheduler coalesce directory-block writes on rotating disks
+        if self.SORT_MOVES_BY_INODE:
+            for files in plan.values():
+                files.sort(key=itemgetter(3))
+
+        # Create only the missing folders that will receive a file, then overlap the moves on a thread pool.
+        # A folder that cannot be created only skips that category's files, as a per-file failure would.
+        for category, dest_folder_path in list(dest_folders.items()):
+            if dest_folder_path in created_dirs:
+                continue
+            try:
+                os.makedirs(dest_folder_path, exist_ok=True)
+                created_dirs.add(dest_folder_path)
+            except OSError as e:
+                for _, item_name, _, _ in plan[category]:
+                    self.log_and_update(f"Error moving '{item_name}': could not create folder '{category}': {e}", "error")
+                del dest_folders[category]
+
+        def move_file(source, dest, item_name, category):
+            self._move_without_overwrite(source, dest)
+            with self.move_lock:
+                self.last_move_actions.append((category, item_name))
 
-        except Exception as e:
-            log_and_update(f"An unexpected error occurred: {e}", "error")
-        finally:
-            self.root.after(0, self.finalize_organization, dry_run)
+        files_processed_count = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(move_file, source, f"{dest_folders[category]}{sep}{item_name}", item_name, category): (item_name, category)
+                       for category, files in plan.items() if category in dest_folders
+                       for source, item_name, _, _ in files}
+            self.report_progress(0)
+            last_percent = 0
+            for done, future in enumerate(as_completed(futures), 1):
+                item_name, category = futures[future]
+                try:
+                    future.result()
+                    self.log_and_update(f"Moved: '{item_name}' -> '{category}'")
+                    files_processed_count += 1
+                except FileExistsError as e:
+                    self.log_and_update(f"Warning: Could not move '{item_name}'. It may already exist. Details: {e}", "warning")
+                except Exception as e:
+                    self.log_and_update(f"Error moving '{item_name}': {e}", "error")
+                percent = done * 100 // len(futures)
+                if percent != last_percent:
+                    self.report_progress(percent)
+                    last_percent = percent
+
+        if files_processed_count > self.UNDO_HISTORY_LIMIT:
+            self.log_and_update(f"Warning: Only the last {self.UNDO_HISTORY_LIMIT} moves can be undone.", "warning")
+        return files_processed_count
+
+    # errno values meaning "no hard link possible here", where a checked shutil.move is used instead
+    _LINK_FALLBACK_ERRNOS = frozenset([errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP])
+
+    def _move_without_overwrite(self, source: str, dest: str):
+        """
+        Moves source to dest, raising FileExistsError instead of replacing an existing dest.
+        Windows' os.rename already refuses to overwrite; on POSIX, link + unlink gives the same
+        guarantee atomically, where os.rename and os.replace would silently clobber.
+        """
+        try:
+            if os.name == "nt":
+                os.rename(source, dest)
+                return
+            os.link(source, dest, follow_symlinks=False)
+        except FileExistsError:
+            raise
+        except OSError as e:
+            if e.errno not in self._LINK_FALLBACK_ERRNOS:
+                raise
+            # Cross-device, or a filesystem without hard links (e.g. FAT, some SMB shares)
+            if os.path.lexists(dest):
+                raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dest)
+            shutil.move(source, dest)
+            return
+        try:
+            os.unlink(source)
+        except OSError:
+            os.unlink(dest) # Leave only the original name behind
+            raise
 
     def undo_last_organization(self):
         """Reverts the last set of file movements."""
@@ -162,22 +327,21 @@ class FileOrganizerApp:
             messagebox.showinfo("Undo", "No actions to undo.")
             return
 
-        def log_and_update(message: str):
-            self.root.after(0, self.update_log_area, message)
-            logging.info(message)
-
-        log_and_update("⏪ Starting undo process...")
+        self.log_and_update("⏪ Starting undo process...")
         self.undo_button.config(state="disabled")
 
-        for source, dest in reversed(self.last_move_actions):
+        target_path = self._last_target_path
+        for category, item_name in reversed(self.last_move_actions):
+            source = os.path.join(target_path, category, item_name)
+            dest = os.path.join(target_path, item_name)
             try:
-                os.makedirs(os.path.dirname(dest), exist_ok=True)
                 shutil.move(source, dest)
-                log_and_update(f"Reverted: '{os.path.basename(source)}'")
+                self.log_and_update(f"Reverted: '{item_name}'")
             except Exception as e:
-                log_and_update(f"Error undoing '{os.path.basename(source)}': {e}")
+                self.log_and_update(f"Error undoing '{item_name}': {e}")
         
-        log_and_update("✅ Undo complete!")
+        self.log_and_update("✅ Undo complete!")
+        self.flush_log_file()
         self.last_move_actions.clear()
 
     # --- Frontend (GUI) Methods ---
@@ -230,6 +394,17 @@ class FileOrganizerApp:
         self.dry_run_check = tk.Checkbutton(self.control_frame, text="Dry Run (Preview changes without moving files)", variable=self.dry_run_var, font=self.font_main)
         self.dry_run_check.pack(anchor="w")
 
+        workers_frame = tk.Frame(self.control_frame)
+        workers_frame.pack(fill="x", pady=(10, 0), anchor="w")
+        self.workers_label = tk.Label(workers_frame, text="Parallel Moves:", font=self.font_main)
+        self.workers_label.pack(side="left", padx=(0, 10))
+        self.max_workers_var = tk.IntVar(value=8)
+        self.workers_spinbox = tk.Spinbox(workers_frame, from_=1, to=32, textvariable=self.max_workers_var, font=self.font_main, width=4, bd=1, relief="solid")
+        self.workers_spinbox.pack(side="left")
+
+        self.progress_bar = ttk.Progressbar(self.control_frame, orient="horizontal", mode="determinate", maximum=100)
+        self.progress_bar.pack(fill="x", pady=(10, 0))
+
         self.log_label = tk.Label(self.control_frame, text="Activity Log:", font=self.font_main)
         self.log_label.pack(anchor="w", pady=(10,0))
         self.log_area = scrolledtext.ScrolledText(self.control_frame, height=15, width=60, font=("Courier New", 10), bd=1, relief="solid", wrap=tk.WORD)
@@ -241,16 +416,18 @@ class FileOrganizerApp:
         
         if MATPLOTLIB_AVAILABLE:
             self.fig = Figure(figsize=(8, 8), dpi=100)
-            (self.ax_bar, self.ax_pie), (self.ax_hist, self.ax_blank) = self.fig.subplots(2, 2)
+            (self.ax_bar, self.ax_size), (self.ax_hist, self.ax_blank) = self.fig.subplots(2, 2)
             self.ax_blank.axis('off')
+            self._bar_container = self._size_bars = self._hist_patches = None # Reused between dashboard updates
+            self._bar_categories = []
             
             self.canvas = FigureCanvasTkAgg(self.fig, master=self.analytics_frame)
             self.canvas_widget = self.canvas.get_tk_widget()
             self.canvas_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
             self.ax_bar.text(0.5, 0.5, 'File counts will be shown here.', ha='center', va='center')
-            self.ax_pie.text(0.5, 0.5, 'File sizes will be shown here.', ha='center', va='center')
+            self.ax_size.text(0.5, 0.5, 'File sizes will be shown here.', ha='center', va='center')
             self.ax_hist.text(0.5, 0.5, 'Size distribution will be shown here.', ha='center', va='center')
-            self.canvas.draw()
+            self.canvas.draw_idle()
         else:
             self.error_label = tk.Label(self.analytics_frame, text="Matplotlib not found.\nPlease run 'pip install matplotlib' for analytics.", font=self.font_main, fg="red", justify="center")
             self.error_label.pack(fill="both", expand=True)
@@ -282,53 +459,113 @@ class FileOrganizerApp:
             messagebox.showerror("Error", f"Could not open email client. Please email support@example.com.\n\nError: {e}")
 
     def format_size(self, size_bytes):
-        if size_bytes == 0: return "0B"
+        # Called for every tick label, so pick the unit with integer bit ops rather than math.log
+        if size_bytes <= 0: return "0B"
         size_name = ("B", "KB", "MB", "GB", "TB")
-        import math
-        i = int(math.floor(math.log(size_bytes, 1024))) if size_bytes > 0 else 0
-        p = math.pow(1024, i)
+        i = min((int(size_bytes).bit_length() - 1) // 10, 4) if size_bytes >= 1 else 0
+        p = 1 << (i * 10)
         s = round(size_bytes / p, 2)
         return f"{s} {size_name[i]}"
 
     def update_analytics_dashboard(self, data, all_file_sizes):
-        self.ax_bar.clear()
-        self.ax_pie.clear()
-        self.ax_hist.clear()
         theme = self.themes['dark' if self.is_dark_mode else 'light']
         
         filtered_data = {cat: info for cat, info in data.items() if info['count'] > 0}
 
         if not filtered_data:
+            self.ax_bar.clear()
+            self.ax_size.clear()
+            self.ax_hist.clear()
+            self._bar_container = self._size_bars = self._hist_patches = None
             self.ax_bar.text(0.5, 0.5, 'No files were processed.', ha='center', va='center', color=theme['text'])
-            self.ax_pie.text(0.5, 0.5, '', ha='center', va='center')
+            self.ax_size.text(0.5, 0.5, '', ha='center', va='center')
             self.ax_hist.text(0.5, 0.5, '', ha='center', va='center')
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
 
         categories = list(filtered_data.keys())
         counts = [info['count'] for info in filtered_data.values()]
-        self.ax_bar.bar(categories, counts, color=theme['primary'])
-        self.ax_bar.set_title('File Count by Category', color=theme['text'])
-        self.ax_bar.tick_params(axis='x', labelrotation=45, labelcolor=theme['text'], labelsize='small')
-        self.ax_bar.tick_params(axis='y', labelcolor=theme['text'])
-
         sizes = [info['size'] for info in filtered_data.values()]
         total_size = sum(sizes)
-        self.ax_pie.pie(sizes, labels=categories, autopct='%1.1f%%', startangle=90, textprops={'color': theme['text'], 'fontsize': 'small'})
-        self.ax_pie.set_title(f'Total Size: {self.format_size(total_size)}', color=theme['text'])
-
-        if all_file_sizes:
-            filtered_sizes = [s for s in all_file_sizes if s > 0]
-            if filtered_sizes:
-                self.ax_hist.hist(filtered_sizes, bins=10, color=theme['primary'], log=True)
+        relayout = False
+
+        # Rebuilding artists is the costly part of a refresh, so only do it when the categories change
+        if self._bar_container is not None and self._bar_categories == categories:
+            for patch, count in zip(self._bar_container.patches, counts):
+                patch.set_height(count)
+            self.ax_bar.relim()
+            self.ax_bar.autoscale_view()
+            self._update_size_artists(categories, sizes, theme)
+        else:
+            self.ax_bar.clear()
+            self.ax_size.clear()
+            self._bar_container = self.ax_bar.bar(categories, counts, color=theme['primary'])
+            self._bar_categories = categories
+            self.ax_bar.set_title('File Count by Category', color=theme['text'])
+            self.ax_bar.tick_params(axis='x', labelrotation=45, labelcolor=theme['text'], labelsize='small')
+            self.ax_bar.tick_params(axis='y', labelcolor=theme['text'])
+            # One stacked horizontal bar is far cheaper to lay out and draw than a labelled pie
+            lefts = np.cumsum([0] + sizes[:-1])
+            self._size_bars = self.ax_size.barh(np.zeros(len(sizes)), sizes, left=lefts, height=0.5,
+                                                color=plt.cm.tab10(np.arange(len(sizes)) % 10))
+            self._size_labels = [self.ax_size.text(0, 0, '', ha='center', va='center', fontsize='small')
+                                 for _ in categories]
+            self.ax_size.set_xticks([])
+            self.ax_size.set_yticks([])
+            self._update_size_artists(categories, sizes, theme)
+            relayout = True
+        self.ax_size.set_title(f'Total Size: {self.format_size(total_size)}', color=theme['text'])
+
+        filtered_sizes = all_file_sizes[all_file_sizes > 0]
+        if filtered_sizes.size:
+            # Log-spaced edges so the bins are evenly sized on the log x-axis
+            smallest, largest = filtered_sizes.min(), filtered_sizes.max()
+            if largest > smallest:
+                bins = np.logspace(np.log10(smallest), np.log10(largest), 11)
+                # Pin the outer edges to the data exactly: the log10/logspace round trip can land just
+                # inside them, and np.histogram would then silently drop the smallest or largest files
+                bins[0], bins[-1] = smallest, largest
+            else:
+                bins = 10
+            if self._hist_patches is not None:
+                heights, edges = np.histogram(filtered_sizes, bins=bins)
+                for patch, height, left, right in zip(self._hist_patches, heights, edges[:-1], edges[1:]):
+                    patch.set_x(left)
+                    patch.set_width(right - left)
+                    patch.set_height(height)
+                self.ax_hist.relim()
+                self.ax_hist.autoscale_view()
+            else:
+                self.ax_hist.clear()
+                self._hist_patches = self.ax_hist.hist(filtered_sizes, bins=bins, color=theme['primary'], log=True)[2]
                 self.ax_hist.set_xscale('log')
                 self.ax_hist.xaxis.set_major_formatter(FuncFormatter(lambda x, pos: self.format_size(x)))
                 self.ax_hist.set_title('File Size Distribution', color=theme['text'])
                 self.ax_hist.tick_params(axis='x', labelrotation=45, labelcolor=theme['text'], labelsize='small')
                 self.ax_hist.tick_params(axis='y', labelcolor=theme['text'])
-
-        self.fig.tight_layout(pad=3.0)
-        self.canvas.draw()
+                relayout = True
+        else:
+            self.ax_hist.clear()
+            self._hist_patches = None
+
+        if relayout:
+            self.fig.tight_layout(pad=3.0)
+        self.canvas.draw_idle()
+
+    def _update_size_artists(self, categories, sizes, theme):
+        """Resizes the stacked size-bar segments in place; only segments over 5% get a label."""
+        total_size = sum(sizes) or 1
+        lefts = np.cumsum([0] + sizes[:-1])
+        for bar, label, category, size, left in zip(self._size_bars, self._size_labels, categories, sizes, lefts):
+            bar.set_x(left)
+            bar.set_width(size)
+            frac = size / total_size
+            label.set_position((left + size / 2, 0))
+            label.set_text(f"{category}\n{100 * frac:1.1f}%")
+            label.set_color(theme['text'])
+            label.set_visible(frac > 0.05)
+        self.ax_size.set_xlim(0, total_size)
+        self.ax_size.set_ylim(-0.5, 0.5)
 
     def toggle_dark_mode(self):
         self.is_dark_mode = not self.is_dark_mode
@@ -340,13 +577,14 @@ class FileOrganizerApp:
         theme = self.themes[theme_name]
         self.root.config(bg=theme['secondary'])
         
-        for frame in [self.container, self.control_frame, self.analytics_frame, self.title_label.master, self.dir_label.master, self.organize_button.master]:
+        for frame in [self.container, self.control_frame, self.analytics_frame, self.title_label.master, self.dir_label.master, self.organize_button.master, self.workers_label.master]:
             frame.config(bg=theme['secondary'])
 
-        for label in [self.title_label, self.dir_label, self.log_label, self.analytics_title]:
+        for label in [self.title_label, self.dir_label, self.log_label, self.analytics_title, self.workers_label]:
             label.config(bg=theme['secondary'], fg=theme['text'])
 
         self.dir_entry.config(bg=theme['accent'], fg=theme['text'], insertbackground=theme['text'])
+        self.workers_spinbox.config(bg=theme['accent'], fg=theme['text'], buttonbackground=theme['accent'], insertbackground=theme['text'])
         self.browse_button.config(bg=theme['primary'], fg=theme['button_fg'])
         self.organize_button.config(bg=theme['primary'], fg=theme['button_fg'])
         self.undo_button.config(bg=theme['accent'], fg=theme['text'])
@@ -356,7 +594,7 @@ class FileOrganizerApp:
         self.log_area.config(bg=theme['accent'], fg=theme['text'], insertbackground=theme['text'])
         if MATPLOTLIB_AVAILABLE:
             self.fig.patch.set_facecolor(theme['secondary'])
-            for ax in [self.ax_bar, self.ax_pie, self.ax_hist]:
+            for ax in [self.ax_bar, self.ax_size, self.ax_hist]:
                 ax.set_facecolor(theme['accent'])
                 ax.title.set_color(theme['text'])
                 for spine in ax.spines.values():
@@ -365,7 +603,7 @@ class FileOrganizerApp:
                 ax.yaxis.label.set_color(theme['text'])
                 ax.tick_params(axis='x', colors=theme['text'])
                 ax.tick_params(axis='y', colors=theme['text'])
-            self.canvas.draw()
+            self.canvas.draw_idle()
         else:
             self.error_label.config(bg=theme['accent'])
 
@@ -381,12 +619,21 @@ class FileOrganizerApp:
             messagebox.showerror("Error", "Please select a valid directory first.")
             return
 
+        try:
+            max_workers = self.max_workers_var.get()
+        except tk.TclError:
+            max_workers = 0
+        if max_workers < 1:
+            messagebox.showerror("Error", "Parallel moves must be a whole number of at least 1.")
+            return
+
         self.organize_button.config(state="disabled", text="Organizing...")
         self.undo_button.config(state="disabled")
         self.log_area.delete('1.0', tk.END)
-        
+        self.progress_bar["value"] = 0
+
         is_dry_run = self.dry_run_var.get()
-        thread = threading.Thread(target=self.organize_directory, args=(target_path, is_dry_run), daemon=True)
+        thread = threading.Thread(target=self.organize_directory, args=(target_path, is_dry_run, max_workers), daemon=True)
         thread.start()
         
     def start_undo_thread(self):
@@ -397,6 +644,36 @@ class FileOrganizerApp:
         self.log_area.insert(tk.END, message + "\n")
         self.log_area.see(tk.END)
 
+    def _drain_log_queue(self):
+        """Flushes all pending log lines in one insert and applies the latest progress, then reschedules itself (~30 Hz)."""
+        messages = []
+        progress = None
+        while True:
+            try:
+                item = self.log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, tuple):
+                progress = item
+            else:
+                messages.append(item)
+        if messages:
+            self.update_log_area("\n".join(messages))
+        if progress is not None:
+            self.update_progress_bar(progress[1])
+        self.root.after(33, self._drain_log_queue)
+
+    def update_progress_bar(self, percent):
+        if percent is None:
+            if str(self.progress_bar.cget("mode")) != "indeterminate":
+                self.progress_bar.config(mode="indeterminate")
+                self.progress_bar.start(20)
+            return
+        if str(self.progress_bar.cget("mode")) == "indeterminate":
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate")
+        self.progress_bar["value"] = percent
+
     def finalize_organization(self, was_dry_run):
         self.organize_button.config(state="normal", text="Organize Files")
         if not was_dry_run and self.last_move_actions: